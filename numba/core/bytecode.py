@@ -32,6 +32,28 @@ def get_code_object(obj):
     return getattr(obj, '__code__', getattr(obj, 'func_code', None))
 
 
+def get_arg_names(code):
+    """
+    Get the argument names of the function of the code object *code*, in the
+    order of its signature: positional, ``*args``, keyword-only then
+    ``**kwargs``.  As in ``inspect.signature()``, the implicit ``.N``
+    arguments of comprehensions are named ``implicitN``.
+    """
+    nargs = code.co_argcount
+    nkwonly = code.co_kwonlyargcount
+    names = ['implicit{}'.format(name[1:])
+             if name[0] == '.' and name[1:].isdigit() else name
+             for name in code.co_varnames[:nargs]]
+    pos = nargs + nkwonly
+    if code.co_flags & inspect.CO_VARARGS:
+        names.append(code.co_varnames[pos])
+        pos += 1
+    names.extend(code.co_varnames[nargs:nargs + nkwonly])
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        names.append(code.co_varnames[pos])
+    return names
+
+
 def _as_opcodes(seq):
     lst = []
     for s in seq:
@@ -300,7 +322,6 @@ class FunctionIdentity(serialize.ReduceMixin):
         """
         func = get_function_object(pyfunc)
         code = get_code_object(func)
-        pysig = utils.pysignature(func)
         if not code:
             raise errors.ByteCodeSupportError(
                 "%s does not provide its bytecode" % func)
@@ -320,11 +341,10 @@ class FunctionIdentity(serialize.ReduceMixin):
                         if self.module is None
                         else self.module.__name__)
         self.is_generator = inspect.isgeneratorfunction(func)
-        self.pysig = pysig
         self.filename = code.co_filename
         self.firstlineno = code.co_firstlineno
-        self.arg_count = len(pysig.parameters)
-        self.arg_names = list(pysig.parameters)
+        self.arg_names = get_arg_names(code)
+        self.arg_count = len(self.arg_names)
 
         # Even the same function definition can be compiled into
         # several different function objects with distinct closure
@@ -334,6 +354,17 @@ class FunctionIdentity(serialize.ReduceMixin):
 
         return self
 
+    @utils.cached_property
+    def pysig(self):
+        """
+        The inspect.Signature of the function, computed on first use.
+
+        Note that *arg_names* are those of the compiled bytecode, whereas
+        the signature follows ``__wrapped__`` and ``__signature__``, so the
+        two differ for a function wrapped with ``functools.wraps``.
+        """
+        return utils.pysignature(self.func)
+
     def derive(self):
         """Copy the object and increment the unique counter.
         """
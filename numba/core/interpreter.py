@@ -1,6 +1,7 @@
 import builtins
 import collections
 import dis
+import inspect
 import operator
 import logging
 
@@ -314,9 +315,100 @@ def peep_hole_delete_with_exit(func_ir):
     return func_ir
 
 
+# Marker for a missing cache entry, ir.UNDEFINED is a valid cached value
+_MISSING = object()
+
+# { opname : opname } of the opcodes handled by another opcode's handler,
+# see Interpreter._get_op_table()
+#
+# NOTE: The LOAD_METHOD opcode is implemented as a LOAD_ATTR for ease,
+# however this means a new object (the bound-method instance) could be
+# created. Conversely, using a pure LOAD_METHOD no intermediary is present
+# and it is essentially like a pointer grab and forward to CALL_METHOD. The
+# net outcome is that the implementation in Numba produces the same result,
+# but in object mode it may be that it runs more slowly than it would if
+# run in CPython.
+_OPNAME_ALIASES = {
+    'LOAD_METHOD': 'LOAD_ATTR',
+    'CALL_METHOD': 'CALL_FUNCTION',
+}
+
+# { opname : operator } of the binary operation opcodes handled by
+# Interpreter._op_binop()
+_BINOP_OPNAMES = {
+    'BINARY_ADD': '+',
+    'BINARY_SUBTRACT': '-',
+    'BINARY_MULTIPLY': '*',
+    'BINARY_TRUE_DIVIDE': '/',
+    'BINARY_FLOOR_DIVIDE': '//',
+    'BINARY_MODULO': '%',
+    'BINARY_POWER': '**',
+    'BINARY_MATRIX_MULTIPLY': '@',
+    'BINARY_LSHIFT': '<<',
+    'BINARY_RSHIFT': '>>',
+    'BINARY_AND': '&',
+    'BINARY_OR': '|',
+    'BINARY_XOR': '^',
+}
+
+# { opname : operator } of the inplace binary operation opcodes handled by
+# Interpreter._op_inplace_binop()
+_INPLACE_BINOP_OPNAMES = {
+    'INPLACE_ADD': '+',
+    'INPLACE_SUBTRACT': '-',
+    'INPLACE_MULTIPLY': '*',
+    'INPLACE_TRUE_DIVIDE': '/',
+    'INPLACE_FLOOR_DIVIDE': '//',
+    'INPLACE_MODULO': '%',
+    'INPLACE_POWER': '**',
+    'INPLACE_MATRIX_MULTIPLY': '@',
+    'INPLACE_LSHIFT': '<<',
+    'INPLACE_RSHIFT': '>>',
+    'INPLACE_AND': '&',
+    'INPLACE_OR': '|',
+    'INPLACE_XOR': '^',
+}
+
+# { opname : fn } of the ir.Expr.binop function of each binary operation
+# opcode, resolved once instead of on every instruction
+_BINOP_FNS = {opname: BINOPS_TO_OPERATORS[op]
+              for opname, op in _BINOP_OPNAMES.items()}
+
+# { opname : (fn, immutable_fn) } of the ir.Expr.inplace_binop functions of
+# each inplace binary operation opcode
+_INPLACE_BINOP_FNS = {opname: (INPLACE_BINOPS_TO_OPERATORS[op + '='],
+                               BINOPS_TO_OPERATORS[op])
+                      for opname, op in _INPLACE_BINOP_OPNAMES.items()}
+
+
+def _bind_handler_args(params, kws):
+    """
+    Order the keyword arguments *kws* of a bytecode handler into a tuple of
+    positional arguments according to *params*, the handler's
+    ``(name, default)`` sequence from ``Interpreter._get_op_table()``.
+    """
+    args = tuple([kws.get(name, default) for name, default in params])
+    # Compare by identity, the values are arbitrary dataflow values
+    if (set(kws).difference(name for name, _ in params)
+            or any(a is inspect.Parameter.empty for a in args)):
+        raise TypeError("bad handler arguments: %s" % (kws,))
+    return args
+
+
 class Interpreter(object):
     """A bytecode interpreter that builds up the IR.
     """
+    # A new instance is created for every function compiled and its
+    # attributes are read on every instruction, avoid the __dict__.
+    __slots__ = (
+        'func_id', 'arg_count', 'arg_names', 'loc', 'first_loc',
+        'is_generator', 'blocks', 'definitions', '_exception_vars',
+        '_loc_cache', '_global_cache',
+        # set by interpret()
+        'bytecode', 'scopes', 'cfa', 'dfa', 'current_block',
+        'current_block_offset', '_on_backbone', 'syntax_blocks', 'dfainfo',
+        'assigner', '_scope', '_program', '_opnames',
+    )
 
     def __init__(self, func_id):
         self.func_id = func_id
@@ -332,6 +424,10 @@ class Interpreter(object):
         # A set to keep track of all exception variables.
         # To be used in _legalize_exception_vars()
         self._exception_vars = set()
+        # { lineno : ir.Loc }, see _get_loc()
+        self._loc_cache = {}
+        # { co_names index : value } of the resolved LOAD_GLOBAL values
+        self._global_cache = {}
 
     def interpret(self, bytecode):
         """
@@ -340,7 +436,7 @@ class Interpreter(object):
         self.bytecode = bytecode
 
         self.scopes = []
-        global_scope = ir.Scope(parent=None, loc=self.loc)
+        global_scope = ir.Scope(None, self.loc)
         self.scopes.append(global_scope)
 
         if PYVERSION < (3, 7):
@@ -364,26 +460,33 @@ class Interpreter(object):
         # Temp states during interpretation
         self.current_block = None
         self.current_block_offset = None
+        # Whether the current block is on the backbone, see insert_block()
+        self._on_backbone = False
         self.syntax_blocks = []
         self.dfainfo = None
 
-        self.scopes.append(ir.Scope(parent=self.current_scope, loc=self.loc))
+        self.scopes.append(ir.Scope(self.current_scope, self.loc))
+        # The scope of all the blocks, the scopes are not changed past here
+        self._scope = self.current_scope
         # Interpret loop
-        for inst, kws in self._iter_inst():
-            self._dispatch(inst, kws)
+        self._compile_program()
+        self._run_program()
         self._legalize_exception_vars()
         # Prepare FunctionIR
         func_ir = ir.FunctionIR(self.blocks, self.is_generator, self.func_id,
                                 self.first_loc, self.definitions,
                                 self.arg_count, self.arg_names)
-        _logger.debug(func_ir.dump_to_string())
+        # Rendering the IR is costly, only do it if it will be logged
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(func_ir.dump_to_string())
 
         # post process the IR to rewrite opcodes/byte sequences that are too
         # involved to risk handling as part of direct interpretation
         peepholes = []
-        if PYVERSION == (3, 9):
+        if PYVERSION == (3, 9) and self._contains_opname('LIST_TO_TUPLE'):
             peepholes.append(peep_hole_list_to_tuple)
-        peepholes.append(peep_hole_delete_with_exit)
+        if self._contains_opname('SETUP_WITH'):
+            peepholes.append(peep_hole_delete_with_exit)
 
         post_processed_ir = self.post_process(peepholes, func_ir)
         return post_processed_ir
@@ -397,6 +500,9 @@ class Interpreter(object):
         """Search for unsupported use of exception variables.
         Note, they cannot be stored into user variable.
         """
+        # Most functions have no exception variables, skip the scan
+        if not self._exception_vars:
+            return
         # Build a set of exception variables
         excvars = self._exception_vars.copy()
         # Propagate the exception variables to LHS of assignment
@@ -407,33 +513,102 @@ class Interpreter(object):
                     if k in excvars:
                         excvars.add(varname)
         # Filter out the user variables.
-        uservar = list(filter(lambda x: not x.startswith('$'), excvars))
+        uservar = [x for x in excvars if not x.startswith('$')]
         if uservar:
             # Complain about the first user-variable storing an exception
             first = uservar[0]
-            loc = self.current_scope.get(first).loc
+            loc = self._scope.get(first).loc
             msg = "Exception object cannot be stored into variable ({})."
             raise errors.UnsupportedError(msg.format(first), loc=loc)
 
     def init_first_block(self):
         # Define variables receiving the function arguments
         for index, name in enumerate(self.arg_names):
-            val = ir.Arg(index=index, name=name, loc=self.loc)
+            val = ir.Arg(name, index, self.loc)
             self.store(val, name)
 
-    def _iter_inst(self):
-        for blkct, block in enumerate(self.cfa.iterliveblocks()):
-            firstinst = self.bytecode[block.offset]
-            self.loc = self.loc.with_lineno(firstinst.lineno)
-            self._start_new_block(block.offset)
+    def _compile_program(self):
+        """
+        Resolve the handler of every live instruction ahead of interpretation.
+
+        The result is stored in ``self._program`` as a list of
+        ``(offset, loc, ops)`` for each live block, where *ops* is a list of
+        ``(fn, inst, args, loc)`` and *fn* is the handler function to be called
+        as ``fn(self, inst, *args)`` with ``self.loc`` set to *loc*.  The
+        keyword arguments recorded by the dataflow analysis are ordered into
+        the positional *args* here, once.
+
+        The opnames of all the live instructions are recorded in
+        ``self._opnames``.
+        """
+        op_table = self._get_op_table()
+        get_loc = self._get_loc
+        # { offset : ByteCodeInst }, read directly to skip __getitem__
+        insts = self.bytecode.table
+        dfa_infos = self.dfa.infos
+        program = []
+        # The set of opnames in the live blocks
+        opnames = self._opnames = set()
+        for block in self.cfa.iterliveblocks():
+            ops = []
+            for offset, kws in dfa_infos[block.offset].insts:
+                inst = insts[offset]
+                opnames.add(inst.opname)
+                try:
+                    fn, params = op_table[inst.opname]
+                except KeyError:
+                    raise NotImplementedError(inst)
+                ops.append((fn, inst, _bind_handler_args(params, kws),
+                            get_loc(inst.lineno)))
+            firstinst = insts[block.offset]
+            program.append((block.offset, get_loc(firstinst.lineno), ops))
+        self._program = program
+
+    def _run_program(self):
+        """
+        Execute the program prepared by ``_compile_program()``.
+        """
+        start_new_block = self._start_new_block
+        end_current_block = self._end_current_block
+        for blkct, (offset, loc, ops) in enumerate(self._program):
+            self.loc = loc
+            start_new_block(offset)
             if blkct == 0:
                 # Is first block
                 self.init_first_block()
-            for offset, kws in self.dfainfo.insts:
-                inst = self.bytecode[offset]
-                self.loc = self.loc.with_lineno(inst.lineno)
-                yield inst, kws
-            self._end_current_block()
+            for fn, inst, args, op_loc in ops:
+                self.loc = op_loc
+                try:
+                    fn(self, inst, *args)
+                except errors.NotDefinedError as e:
+                    if e.loc is None:
+                        err_loc = self.loc
+                    else:
+                        err_loc = e.loc
+
+                    err = errors.NotDefinedError(e.name, loc=err_loc)
+                    if not config.FULL_TRACEBACKS:
+                        raise err from None
+                    else:
+                        raise err
+            end_current_block()
+
+    def _contains_opname(self, opname):
+        """
+        Whether any live block contains an *opname* instruction.
+        """
+        return opname in self._opnames
+
+    def _get_loc(self, lineno):
+        """
+        Get the ir.Loc of *lineno* in this function.  A single instance is
+        shared by all the instructions on the same line.
+        """
+        loc = self._loc_cache.get(lineno)
+        if loc is None:
+            loc = self.first_loc.with_lineno(lineno)
+            self._loc_cache[lineno] = loc
+        return loc
 
     def _start_new_block(self, offset):
         oldblock = self.current_block
@@ -447,26 +622,21 @@ class Interpreter(object):
                 # We are in a try-block, insert a branch to except-block.
                 # This logic cannot be in self._end_current_block()
                 # because we the non-raising next block-offset.
-                branch = ir.Branch(
-                    cond=self.get('$exception_check'),
-                    truebr=tryblk['end'],
-                    falsebr=offset,
-                    loc=self.loc,
-                )
+                branch = ir.Branch(self.get('$exception_check'),
+                                   tryblk['end'], offset, self.loc)
                 oldblock.append(branch)
             # Handle normal case
             else:
-                jmp = ir.Jump(offset, loc=self.loc)
+                jmp = ir.Jump(offset, self.loc)
                 oldblock.append(jmp)
         # Get DFA block info
         self.dfainfo = self.dfa.infos[self.current_block_offset]
         self.assigner = Assigner()
-        # Check out-of-scope syntactic-block
-        while self.syntax_blocks:
-            if offset >= self.syntax_blocks[-1].exit:
-                self.syntax_blocks.pop()
-            else:
-                break
+        # Check out-of-scope syntactic-block, they are nested so only the
+        # innermost ones at the end of the list can have been exited
+        syntax_blocks = self.syntax_blocks
+        while syntax_blocks and offset >= syntax_blocks[-1].exit:
+            syntax_blocks.pop()
 
     def _end_current_block(self):
         # Handle try block
@@ -491,9 +661,9 @@ class Interpreter(object):
             The variable name to be used to store the call result.
             If ``None``, a name is created automatically.
         """
-        gv_fn = ir.Global(gv_name, func, loc=self.loc)
+        gv_fn = ir.Global(gv_name, func, self.loc)
         self.store(value=gv_fn, name=gv_name, redefine=True)
-        callres = ir.Expr.call(self.get(gv_name), (), (), loc=self.loc)
+        callres = ir.Expr.call(self.get(gv_name), (), (), self.loc)
         res_name = res_name or '$callres_{}'.format(gv_name)
         self.store(value=callres, name=res_name, redefine=True)
 
@@ -517,7 +687,7 @@ class Interpreter(object):
         # Note: the last value on the stack is the exception value
         # Note: due to the current limitation, all exception variables are None
         if edgepushed:
-            const_none = ir.Const(value=None, loc=self.loc)
+            const_none = ir.Const(None, self.loc)
             # For each variable going to the handler block.
             for var in edgepushed:
                 if var in self.definitions:
@@ -609,16 +779,25 @@ class Interpreter(object):
         Add assignments to forward requested outgoing values
         to subsequent blocks.
         """
-        for phiname, varname in self.dfainfo.outgoing_phis.items():
-            target = self.current_scope.get_or_define(phiname,
-                                                      loc=self.loc)
-            stmt = ir.Assign(value=self.get(varname), target=target,
-                             loc=self.loc)
-            self.definitions[target.name].append(stmt.value)
-            if not self.current_block.is_terminated:
-                self.current_block.append(stmt)
+        outgoing_phis = self.dfainfo.outgoing_phis
+        # Most blocks, e.g. all of straight-line code, forward nothing
+        if not outgoing_phis:
+            return
+        scope = self._scope
+        block = self.current_block
+        definitions = self.definitions
+        get = self.get
+        loc = self.loc
+        # Inserting assignments does not change whether the block is terminated
+        is_terminated = block.is_terminated
+        for phiname, varname in outgoing_phis.items():
+            target = scope.get_or_define(phiname, loc)
+            stmt = ir.Assign(get(varname), target, loc)
+            definitions[target.name].append(stmt.value)
+            if not is_terminated:
+                block.append(stmt)
             else:
-                self.current_block.insert_before_terminator(stmt)
+                block.insert_before_terminator(stmt)
 
     def get_global_value(self, name):
         """
@@ -665,27 +844,35 @@ class Interpreter(object):
     def code_freevars(self):
         return self.bytecode.co_freevars
 
-    def _dispatch(self, inst, kws):
-        assert self.current_block is not None
-        fname = "op_%s" % inst.opname.replace('+', '_')
-        try:
-            fn = getattr(self, fname)
-        except AttributeError:
-            raise NotImplementedError(inst)
-        else:
-            try:
-                return fn(inst, **kws)
-            except errors.NotDefinedError as e:
-                if e.loc is None:
-                    loc = self.loc
-                else:
-                    loc = e.loc
-
-                err = errors.NotDefinedError(e.name, loc=loc)
-                if not config.FULL_TRACEBACKS:
-                    raise err from None
-                else:
-                    raise err
+    @classmethod
+    def _get_op_table(cls):
+        """
+        Get the ``{opname: (handler, params)}`` table of the bytecode handlers
+        defined on *cls*.  The handlers are the plain functions (not bound
+        methods) and *params* is their ``(name, default)`` sequence of
+        arguments following ``inst``.  The opcodes in _OPNAME_ALIASES
+        without a handler of their own use the handler of their alias,
+        looked up on *cls*.  The table is built on first use and cached
+        on the class.
+        """
+        table = cls.__dict__.get('_OP_TABLE')
+        if table is None:
+            table = {}
+            for opname in dis.opname:
+                fn = getattr(cls, "op_%s" % opname.replace('+', '_'), None)
+                if fn is None:
+                    if opname in _OPNAME_ALIASES:
+                        fn = getattr(cls, "op_%s" % _OPNAME_ALIASES[opname])
+                    elif opname in _BINOP_OPNAMES:
+                        fn = cls._op_binop
+                    elif opname in _INPLACE_BINOP_OPNAMES:
+                        fn = cls._op_inplace_binop
+                if fn is not None:
+                    params = list(inspect.signature(fn).parameters.values())
+                    table[opname] = fn, tuple((p.name, p.default)
+                                              for p in params[2:])
+            cls._OP_TABLE = table
+        return table
 
     # --- Scope operations ---
 
@@ -694,15 +881,14 @@ class Interpreter(object):
         Store *value* (a Expr or Var instance) into the variable named *name*
         (a str object). Returns the target variable.
         """
-        if redefine or self.current_block_offset in self.cfa.backbone:
+        if redefine or self._on_backbone:
             rename = not (name in self.code_cellvars)
-            target = self.current_scope.redefine(name, loc=self.loc,
-                                                 rename=rename)
+            target = self._scope.redefine(name, self.loc, rename=rename)
         else:
-            target = self.current_scope.get_or_define(name, loc=self.loc)
+            target = self._scope.get_or_define(name, self.loc)
         if isinstance(value, ir.Var):
             value = self.assigner.assign(value, target)
-        stmt = ir.Assign(value=value, target=target, loc=self.loc)
+        stmt = ir.Assign(value, target, self.loc)
         self.current_block.append(stmt)
         self.definitions[target.name].append(value)
         return target
@@ -720,18 +906,19 @@ class Interpreter(object):
         # variable assigned to *name*.
         var = self.assigner.get_assignment_source(name)
         if var is None:
-            var = self.current_scope.get(name)
+            var = self._scope.get(name)
         return var
 
     # --- Block operations ---
 
     def insert_block(self, offset, scope=None, loc=None):
-        scope = scope or self.current_scope
+        scope = scope or self._scope
         loc = loc or self.loc
-        blk = ir.Block(scope=scope, loc=loc)
+        blk = ir.Block(scope, loc)
         self.blocks[offset] = blk
         self.current_block = blk
         self.current_block_offset = offset
+        self._on_backbone = offset in self.cfa.backbone
         return blk
 
     # --- Bytecode handlers ---
@@ -741,29 +928,27 @@ class Interpreter(object):
 
     def op_PRINT_ITEM(self, inst, item, printvar, res):
         item = self.get(item)
-        printgv = ir.Global("print", print, loc=self.loc)
+        printgv = ir.Global("print", print, self.loc)
         self.store(value=printgv, name=printvar)
-        call = ir.Expr.call(self.get(printvar), (item,), (), loc=self.loc)
+        call = ir.Expr.call(self.get(printvar), (item,), (), self.loc)
         self.store(value=call, name=res)
 
     def op_PRINT_NEWLINE(self, inst, printvar, res):
-        printgv = ir.Global("print", print, loc=self.loc)
+        printgv = ir.Global("print", print, self.loc)
         self.store(value=printgv, name=printvar)
-        call = ir.Expr.call(self.get(printvar), (), (), loc=self.loc)
+        call = ir.Expr.call(self.get(printvar), (), (), self.loc)
         self.store(value=call, name=res)
 
     def op_UNPACK_SEQUENCE(self, inst, iterable, stores, tupleobj):
         count = len(stores)
         # Exhaust the iterable into a tuple-like object
-        tup = ir.Expr.exhaust_iter(value=self.get(iterable), loc=self.loc,
-                                   count=count)
+        tup = ir.Expr.exhaust_iter(self.get(iterable), count, self.loc)
         self.store(name=tupleobj, value=tup)
 
         # then index the tuple-like object to extract the values
         for i, st in enumerate(stores):
-            expr = ir.Expr.static_getitem(self.get(tupleobj),
-                                          index=i, index_var=None,
-                                          loc=self.loc)
+            expr = ir.Expr.static_getitem(self.get(tupleobj), i, None,
+                                          self.loc)
             self.store(expr, st)
 
     def op_FORMAT_VALUE(self, inst, value, res, strvar):
@@ -773,9 +958,9 @@ class Interpreter(object):
         https://docs.python.org/3/library/dis.html#opcode-FORMAT_VALUE
         """
         value = self.get(value)
-        strgv = ir.Global("str", str, loc=self.loc)
+        strgv = ir.Global("str", str, self.loc)
         self.store(value=strgv, name=strvar)
-        call = ir.Expr.call(self.get(strvar), (value,), (), loc=self.loc)
+        call = ir.Expr.call(self.get(strvar), (value,), (), self.loc)
         self.store(value=call, name=res)
 
     def op_BUILD_STRING(self, inst, strings, tmps):
@@ -787,16 +972,14 @@ class Interpreter(object):
         count = inst.arg
         # corner case: f""
         if count == 0:
-            const = ir.Const("", loc=self.loc)
+            const = ir.Const("", self.loc)
             self.store(const, tmps[-1])
             return
 
         prev = self.get(strings[0])
         for other, tmp in zip(strings[1:], tmps):
             other = self.get(other)
-            expr = ir.Expr.binop(
-                operator.add, lhs=prev, rhs=other, loc=self.loc
-            )
+            expr = ir.Expr.binop(operator.add, prev, other, self.loc)
             self.store(expr, tmp)
             prev = self.get(tmp)
 
@@ -804,68 +987,68 @@ class Interpreter(object):
         start = self.get(start)
         stop = self.get(stop)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         if step is None:
             sliceinst = ir.Expr.call(self.get(slicevar), (start, stop), (),
-                                     loc=self.loc)
+                                     self.loc)
         else:
             step = self.get(step)
             sliceinst = ir.Expr.call(self.get(slicevar), (start, stop, step),
-                                     (), loc=self.loc)
+                                     (), self.loc)
         self.store(value=sliceinst, name=res)
 
     def op_SLICE_0(self, inst, base, res, slicevar, indexvar, nonevar):
         base = self.get(base)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        index = ir.Expr.call(self.get(slicevar), (none, none), (), loc=self.loc)
+        index = ir.Expr.call(self.get(slicevar), (none, none), (), self.loc)
         self.store(value=index, name=indexvar)
 
-        expr = ir.Expr.getitem(base, self.get(indexvar), loc=self.loc)
+        expr = ir.Expr.getitem(base, self.get(indexvar), self.loc)
         self.store(value=expr, name=res)
 
     def op_SLICE_1(self, inst, base, start, nonevar, res, slicevar, indexvar):
         base = self.get(base)
         start = self.get(start)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, none), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
-        expr = ir.Expr.getitem(base, self.get(indexvar), loc=self.loc)
+        expr = ir.Expr.getitem(base, self.get(indexvar), self.loc)
         self.store(value=expr, name=res)
 
     def op_SLICE_2(self, inst, base, nonevar, stop, res, slicevar, indexvar):
         base = self.get(base)
         stop = self.get(stop)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (none, stop,), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
-        expr = ir.Expr.getitem(base, self.get(indexvar), loc=self.loc)
+        expr = ir.Expr.getitem(base, self.get(indexvar), self.loc)
         self.store(value=expr, name=res)
 
     def op_SLICE_3(self, inst, base, start, stop, res, slicevar, indexvar):
@@ -873,31 +1056,31 @@ class Interpreter(object):
         start = self.get(start)
         stop = self.get(stop)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, stop), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
-        expr = ir.Expr.getitem(base, self.get(indexvar), loc=self.loc)
+        expr = ir.Expr.getitem(base, self.get(indexvar), self.loc)
         self.store(value=expr, name=res)
 
     def op_STORE_SLICE_0(self, inst, base, value, slicevar, indexvar, nonevar):
         base = self.get(base)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        index = ir.Expr.call(self.get(slicevar), (none, none), (), loc=self.loc)
+        index = ir.Expr.call(self.get(slicevar), (none, none), (), self.loc)
         self.store(value=index, name=indexvar)
 
         stmt = ir.SetItem(base, self.get(indexvar), self.get(value),
-                          loc=self.loc)
+                          self.loc)
         self.current_block.append(stmt)
 
     def op_STORE_SLICE_1(self, inst, base, start, nonevar, value, slicevar,
@@ -905,19 +1088,19 @@ class Interpreter(object):
         base = self.get(base)
         start = self.get(start)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, none), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
         stmt = ir.SetItem(base, self.get(indexvar), self.get(value),
-                          loc=self.loc)
+                          self.loc)
         self.current_block.append(stmt)
 
     def op_STORE_SLICE_2(self, inst, base, nonevar, stop, value, slicevar,
@@ -925,19 +1108,19 @@ class Interpreter(object):
         base = self.get(base)
         stop = self.get(stop)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (none, stop,), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
         stmt = ir.SetItem(base, self.get(indexvar), self.get(value),
-                          loc=self.loc)
+                          self.loc)
         self.current_block.append(stmt)
 
     def op_STORE_SLICE_3(self, inst, base, start, stop, value, slicevar,
@@ -946,66 +1129,66 @@ class Interpreter(object):
         start = self.get(start)
         stop = self.get(stop)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, stop), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
         stmt = ir.SetItem(base, self.get(indexvar), self.get(value),
-                          loc=self.loc)
+                          self.loc)
         self.current_block.append(stmt)
 
     def op_DELETE_SLICE_0(self, inst, base, slicevar, indexvar, nonevar):
         base = self.get(base)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        index = ir.Expr.call(self.get(slicevar), (none, none), (), loc=self.loc)
+        index = ir.Expr.call(self.get(slicevar), (none, none), (), self.loc)
         self.store(value=index, name=indexvar)
 
-        stmt = ir.DelItem(base, self.get(indexvar), loc=self.loc)
+        stmt = ir.DelItem(base, self.get(indexvar), self.loc)
         self.current_block.append(stmt)
 
     def op_DELETE_SLICE_1(self, inst, base, start, nonevar, slicevar, indexvar):
         base = self.get(base)
         start = self.get(start)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, none), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
-        stmt = ir.DelItem(base, self.get(indexvar), loc=self.loc)
+        stmt = ir.DelItem(base, self.get(indexvar), self.loc)
         self.current_block.append(stmt)
 
     def op_DELETE_SLICE_2(self, inst, base, nonevar, stop, slicevar, indexvar):
         base = self.get(base)
         stop = self.get(stop)
 
-        nonegv = ir.Const(None, loc=self.loc)
+        nonegv = ir.Const(None, self.loc)
         self.store(value=nonegv, name=nonevar)
         none = self.get(nonevar)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (none, stop,), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
 
-        stmt = ir.DelItem(base, self.get(indexvar), loc=self.loc)
+        stmt = ir.DelItem(base, self.get(indexvar), self.loc)
         self.current_block.append(stmt)
 
     def op_DELETE_SLICE_3(self, inst, base, start, stop, slicevar, indexvar):
@@ -1013,13 +1196,13 @@ class Interpreter(object):
         start = self.get(start)
         stop = self.get(stop)
 
-        slicegv = ir.Global("slice", slice, loc=self.loc)
+        slicegv = ir.Global("slice", slice, self.loc)
         self.store(value=slicegv, name=slicevar)
 
         index = ir.Expr.call(self.get(slicevar), (start, stop), (),
-                             loc=self.loc)
+                             self.loc)
         self.store(value=index, name=indexvar)
-        stmt = ir.DelItem(base, self.get(indexvar), loc=self.loc)
+        stmt = ir.DelItem(base, self.get(indexvar), self.loc)
         self.current_block.append(stmt)
 
     def op_LOAD_FAST(self, inst, res):
@@ -1033,7 +1216,7 @@ class Interpreter(object):
 
     def op_DELETE_FAST(self, inst):
         dstname = self.code_locals[inst.arg]
-        self.current_block.append(ir.Del(dstname, loc=self.loc))
+        self.current_block.append(ir.Del(dstname, self.loc))
 
     def op_DUP_TOPX(self, inst, orig, duped):
         for src, dst in zip(orig, duped):
@@ -1044,19 +1227,18 @@ class Interpreter(object):
 
     def op_STORE_ATTR(self, inst, target, value):
         attr = self.code_names[inst.arg]
-        sa = ir.SetAttr(target=self.get(target), value=self.get(value),
-                        attr=attr, loc=self.loc)
+        sa = ir.SetAttr(self.get(target), attr, self.get(value), self.loc)
         self.current_block.append(sa)
 
     def op_DELETE_ATTR(self, inst, target):
         attr = self.code_names[inst.arg]
-        sa = ir.DelAttr(target=self.get(target), attr=attr, loc=self.loc)
+        sa = ir.DelAttr(self.get(target), attr, self.loc)
         self.current_block.append(sa)
 
     def op_LOAD_ATTR(self, inst, item, res):
         item = self.get(item)
         attr = self.code_names[inst.arg]
-        getattr = ir.Expr.getattr(item, attr, loc=self.loc)
+        getattr = ir.Expr.getattr(item, attr, self.loc)
         self.store(getattr, res)
 
     def op_LOAD_CONST(self, inst, res):
@@ -1065,26 +1247,29 @@ class Interpreter(object):
             st = []
             for x in value:
                 nm = '$const_%s' % str(x)
-                val_const = ir.Const(x, loc=self.loc)
+                val_const = ir.Const(x, self.loc)
                 target = self.store(val_const, name=nm, redefine=True)
                 st.append(target)
-            const = ir.Expr.build_tuple(st, loc=self.loc)
+            const = ir.Expr.build_tuple(st, self.loc)
         elif isinstance(value, frozenset):
             st = []
             for x in value:
                 nm = '$const_%s' % str(x)
-                val_const = ir.Const(x, loc=self.loc)
+                val_const = ir.Const(x, self.loc)
                 target = self.store(val_const, name=nm, redefine=True)
                 st.append(target)
-            const = ir.Expr.build_set(st, loc=self.loc)
+            const = ir.Expr.build_set(st, self.loc)
         else:
-            const = ir.Const(value, loc=self.loc)
+            const = ir.Const(value, self.loc)
         self.store(const, res)
 
     def op_LOAD_GLOBAL(self, inst, res):
         name = self.code_names[inst.arg]
-        value = self.get_global_value(name)
-        gl = ir.Global(name, value, loc=self.loc)
+        value = self._global_cache.get(inst.arg, _MISSING)
+        if value is _MISSING:
+            value = self.get_global_value(name)
+            self._global_cache[inst.arg] = value
+        gl = ir.Global(name, value, self.loc)
         self.store(gl, res)
 
     def op_LOAD_DEREF(self, inst, res):
@@ -1096,7 +1281,7 @@ class Interpreter(object):
             idx = inst.arg - n_cellvars
             name = self.code_freevars[idx]
             value = self.get_closure_value(idx)
-            gl = ir.FreeVar(idx, name, value, loc=self.loc)
+            gl = ir.FreeVar(idx, name, value, self.loc)
         self.store(gl, res)
 
     def op_STORE_DEREF(self, inst, value):
@@ -1120,12 +1305,11 @@ class Interpreter(object):
         wth = ir.With(inst.offset, exit=exitpt)
         self.syntax_blocks.append(wth)
         ctxmgr = self.get(contextmanager)
-        self.current_block.append(ir.EnterWith(contextmanager=ctxmgr,
-                                               begin=inst.offset,
-                                               end=exitpt, loc=self.loc,))
+        self.current_block.append(ir.EnterWith(ctxmgr, inst.offset, exitpt,
+                                               self.loc))
 
         # Store exit fn
-        exit_fn_obj = ir.Const(None, loc=self.loc)
+        exit_fn_obj = ir.Const(None, self.loc)
         self.store(value=exit_fn_obj, name=exitfn)
 
     def op_SETUP_EXCEPT(self, inst):
@@ -1149,7 +1333,7 @@ class Interpreter(object):
 
     def op_BEGIN_FINALLY(self, inst, temps):
         # The *temps* are the exception variables
-        const_none = ir.Const(None, loc=self.loc)
+        const_none = ir.Const(None, self.loc)
         for tmp in temps:
             # Set to None for now
             self.store(const_none, name=tmp)
@@ -1177,7 +1361,7 @@ class Interpreter(object):
             for inst in removethese:
                 self.current_block.remove(inst)
 
-            expr = ir.Expr.call(func, args, keyvalues, loc=self.loc,
+            expr = ir.Expr.call(func, args, keyvalues, self.loc,
                                 vararg=vararg)
             self.store(expr, res)
 
@@ -1186,7 +1370,7 @@ class Interpreter(object):
         def op_CALL_FUNCTION(self, inst, func, args, res):
             func = self.get(func)
             args = [self.get(x) for x in args]
-            expr = ir.Expr.call(func, args, (), loc=self.loc)
+            expr = ir.Expr.call(func, args, (), self.loc)
             self.store(expr, res)
 
         def op_CALL_FUNCTION_KW(self, inst, func, args, names, res):
@@ -1214,13 +1398,13 @@ class Interpreter(object):
             kwvals = args[-nkeys:]
             keyvalues = list(zip(keys, kwvals))
 
-            expr = ir.Expr.call(func, posvals, keyvalues, loc=self.loc)
+            expr = ir.Expr.call(func, posvals, keyvalues, self.loc)
             self.store(expr, res)
 
         def op_CALL_FUNCTION_EX(self, inst, func, vararg, res):
             func = self.get(func)
             vararg = self.get(vararg)
-            expr = ir.Expr.call(func, [], [], loc=self.loc, vararg=vararg)
+            expr = ir.Expr.call(func, [], [], self.loc, vararg=vararg)
             self.store(expr, res)
 
     def _build_tuple_unpack(self, inst, tuples, temps, is_assign):
@@ -1230,15 +1414,13 @@ class Interpreter(object):
             # type information.
             # Can deal with tuples only, i.e. y = (*x,). where x = <tuple>
             gv_name = "unpack_single_tuple"
-            gv_fn = ir.Global(gv_name, unpack_single_tuple, loc=self.loc,)
+            gv_fn = ir.Global(gv_name, unpack_single_tuple, self.loc)
             self.store(value=gv_fn, name=gv_name, redefine=True)
-            exc = ir.Expr.call(self.get(gv_name), args=(first,), kws=(),
-                               loc=self.loc,)
+            exc = ir.Expr.call(self.get(gv_name), (first,), (), self.loc)
             self.store(exc, temps[0])
         else:
             for other, tmp in zip(map(self.get, tuples[1:]), temps):
-                out = ir.Expr.binop(fn=operator.add, lhs=first, rhs=other,
-                                    loc=self.loc)
+                out = ir.Expr.binop(operator.add, first, other, self.loc)
                 self.store(out, tmp)
                 first = self.get(tmp)
 
@@ -1250,7 +1432,7 @@ class Interpreter(object):
         self._build_tuple_unpack(inst, tuples, temps, is_assign)
 
     def op_LIST_TO_TUPLE(self, inst, const_list, res):
-        expr = ir.Expr.dummy('list_to_tuple', (const_list,), loc=self.loc)
+        expr = ir.Expr.dummy('list_to_tuple', (const_list,), self.loc)
         self.store(expr, res)
 
     def op_BUILD_CONST_KEY_MAP(self, inst, keys, keytmps, values, res):
@@ -1273,7 +1455,7 @@ class Interpreter(object):
                 keytup = named_items
                 break
         assert len(keytup) == len(values)
-        keyconsts = [ir.Const(value=x, loc=self.loc) for x in keytup]
+        keyconsts = [ir.Const(x, self.loc) for x in keytup]
         for kval, tmp in zip(keyconsts, keytmps):
             self.store(kval, tmp)
         items = list(zip(map(self.get, keytmps), map(self.get, values)))
@@ -1312,16 +1494,13 @@ class Interpreter(object):
         for i, k in enumerate(keytup):
             value_indexes[k] = i
 
-        expr = ir.Expr.build_map(items=items,
-                                 size=2,
-                                 literal_value=literal_dict,
-                                 value_indexes=value_indexes,
-                                 loc=self.loc)
+        expr = ir.Expr.build_map(items, 2, literal_dict, value_indexes,
+                                 self.loc)
 
         self.store(expr, res)
 
     def op_GET_ITER(self, inst, value, res):
-        expr = ir.Expr.getiter(value=self.get(value), loc=self.loc)
+        expr = ir.Expr.getiter(self.get(value), self.loc)
         self.store(expr, res)
 
     def op_FOR_ITER(self, inst, iterator, pair, indval, pred):
@@ -1330,66 +1509,62 @@ class Interpreter(object):
         """
         assert inst.offset in self.blocks, "FOR_ITER must be block head"
 
-        # Emit code
+        # Emit code, the stored temporaries are used directly as they
+        # cannot have a simpler assignment source
+        loc = self.loc
         val = self.get(iterator)
 
-        pairval = ir.Expr.iternext(value=val, loc=self.loc)
-        self.store(pairval, pair)
+        pairval = ir.Expr.iternext(val, loc)
+        pairvar = self.store(pairval, pair)
 
-        iternext = ir.Expr.pair_first(value=self.get(pair), loc=self.loc)
+        iternext = ir.Expr.pair_first(pairvar, loc)
         self.store(iternext, indval)
 
-        isvalid = ir.Expr.pair_second(value=self.get(pair), loc=self.loc)
-        self.store(isvalid, pred)
+        isvalid = ir.Expr.pair_second(pairvar, loc)
+        predvar = self.store(isvalid, pred)
 
         # Conditional jump
-        br = ir.Branch(cond=self.get(pred), truebr=inst.next,
-                       falsebr=inst.get_jump_target(),
-                       loc=self.loc)
+        br = ir.Branch(predvar, inst.next, inst.get_jump_target(), loc)
         self.current_block.append(br)
 
     def op_BINARY_SUBSCR(self, inst, target, index, res):
         index = self.get(index)
         target = self.get(target)
-        expr = ir.Expr.getitem(target, index=index, loc=self.loc)
+        expr = ir.Expr.getitem(target, index, self.loc)
         self.store(expr, res)
 
     def op_STORE_SUBSCR(self, inst, target, index, value):
         index = self.get(index)
         target = self.get(target)
         value = self.get(value)
-        stmt = ir.SetItem(target=target, index=index, value=value,
-                          loc=self.loc)
+        stmt = ir.SetItem(target, index, value, self.loc)
         self.current_block.append(stmt)
 
     def op_DELETE_SUBSCR(self, inst, target, index):
         index = self.get(index)
         target = self.get(target)
-        stmt = ir.DelItem(target=target, index=index, loc=self.loc)
+        stmt = ir.DelItem(target, index, self.loc)
         self.current_block.append(stmt)
 
     def op_BUILD_TUPLE(self, inst, items, res):
-        expr = ir.Expr.build_tuple(items=[self.get(x) for x in items],
-                                   loc=self.loc)
+        expr = ir.Expr.build_tuple([self.get(x) for x in items], self.loc)
         self.store(expr, res)
 
     def op_BUILD_LIST(self, inst, items, res):
-        expr = ir.Expr.build_list(items=[self.get(x) for x in items],
-                                  loc=self.loc)
+        expr = ir.Expr.build_list([self.get(x) for x in items], self.loc)
         self.store(expr, res)
 
     def op_BUILD_SET(self, inst, items, res):
-        expr = ir.Expr.build_set(items=[self.get(x) for x in items],
-                                 loc=self.loc)
+        expr = ir.Expr.build_set([self.get(x) for x in items], self.loc)
         self.store(expr, res)
 
     def op_SET_UPDATE(self, inst, target, value, updatevar, res):
         target = self.get(target)
         value = self.get(value)
-        updateattr = ir.Expr.getattr(target, 'update', loc=self.loc)
+        updateattr = ir.Expr.getattr(target, 'update', self.loc)
         self.store(value=updateattr, name=updatevar)
         updateinst = ir.Expr.call(self.get(updatevar), (value,), (),
-                                  loc=self.loc)
+                                  self.loc)
         self.store(value=updateinst, name=res)
 
     def op_BUILD_MAP(self, inst, items, size, res):
@@ -1430,143 +1605,65 @@ class Interpreter(object):
             for i, k in enumerate(literal_keys):
                 value_indexes[k] = i
 
-        expr = ir.Expr.build_map(items=got_items, size=size,
-                                 literal_value=literal_dict,
-                                 value_indexes=value_indexes,
-                                 loc=self.loc)
+        expr = ir.Expr.build_map(got_items, size, literal_dict,
+                                 value_indexes, self.loc)
         self.store(expr, res)
 
     def op_STORE_MAP(self, inst, dct, key, value):
-        stmt = ir.StoreMap(dct=self.get(dct), key=self.get(key),
-                           value=self.get(value), loc=self.loc)
+        stmt = ir.StoreMap(self.get(dct), self.get(key), self.get(value),
+                           self.loc)
         self.current_block.append(stmt)
 
     def op_UNARY_NEGATIVE(self, inst, value, res):
         value = self.get(value)
-        expr = ir.Expr.unary('-', value=value, loc=self.loc)
+        expr = ir.Expr.unary('-', value, self.loc)
         return self.store(expr, res)
 
     def op_UNARY_POSITIVE(self, inst, value, res):
         value = self.get(value)
-        expr = ir.Expr.unary('+', value=value, loc=self.loc)
+        expr = ir.Expr.unary('+', value, self.loc)
         return self.store(expr, res)
 
     def op_UNARY_INVERT(self, inst, value, res):
         value = self.get(value)
-        expr = ir.Expr.unary('~', value=value, loc=self.loc)
+        expr = ir.Expr.unary('~', value, self.loc)
         return self.store(expr, res)
 
     def op_UNARY_NOT(self, inst, value, res):
         value = self.get(value)
-        expr = ir.Expr.unary('not', value=value, loc=self.loc)
+        expr = ir.Expr.unary('not', value, self.loc)
         return self.store(expr, res)
 
     def _binop(self, op, lhs, rhs, res):
         op = BINOPS_TO_OPERATORS[op]
         lhs = self.get(lhs)
         rhs = self.get(rhs)
-        expr = ir.Expr.binop(op, lhs=lhs, rhs=rhs, loc=self.loc)
+        expr = ir.Expr.binop(op, lhs, rhs, self.loc)
         self.store(expr, res)
 
-    def _inplace_binop(self, op, lhs, rhs, res):
-        immuop = BINOPS_TO_OPERATORS[op]
-        op = INPLACE_BINOPS_TO_OPERATORS[op + '=']
-        lhs = self.get(lhs)
-        rhs = self.get(rhs)
-        expr = ir.Expr.inplace_binop(op, immuop, lhs=lhs, rhs=rhs,
-                                     loc=self.loc)
+    def _op_binop(self, inst, lhs, rhs, res):
+        """
+        Handler of the BINARY_* opcodes listed in _BINOP_OPNAMES.
+        """
+        expr = ir.Expr.binop(_BINOP_FNS[inst.opname], self.get(lhs),
+                             self.get(rhs), self.loc)
         self.store(expr, res)
 
-    def op_BINARY_ADD(self, inst, lhs, rhs, res):
-        self._binop('+', lhs, rhs, res)
-
-    def op_BINARY_SUBTRACT(self, inst, lhs, rhs, res):
-        self._binop('-', lhs, rhs, res)
-
-    def op_BINARY_MULTIPLY(self, inst, lhs, rhs, res):
-        self._binop('*', lhs, rhs, res)
-
-    def op_BINARY_DIVIDE(self, inst, lhs, rhs, res):
-        self._binop('/?', lhs, rhs, res)
-
-    def op_BINARY_TRUE_DIVIDE(self, inst, lhs, rhs, res):
-        self._binop('/', lhs, rhs, res)
-
-    def op_BINARY_FLOOR_DIVIDE(self, inst, lhs, rhs, res):
-        self._binop('//', lhs, rhs, res)
-
-    def op_BINARY_MODULO(self, inst, lhs, rhs, res):
-        self._binop('%', lhs, rhs, res)
-
-    def op_BINARY_POWER(self, inst, lhs, rhs, res):
-        self._binop('**', lhs, rhs, res)
-
-    def op_BINARY_MATRIX_MULTIPLY(self, inst, lhs, rhs, res):
-        self._binop('@', lhs, rhs, res)
-
-    def op_BINARY_LSHIFT(self, inst, lhs, rhs, res):
-        self._binop('<<', lhs, rhs, res)
-
-    def op_BINARY_RSHIFT(self, inst, lhs, rhs, res):
-        self._binop('>>', lhs, rhs, res)
-
-    def op_BINARY_AND(self, inst, lhs, rhs, res):
-        self._binop('&', lhs, rhs, res)
-
-    def op_BINARY_OR(self, inst, lhs, rhs, res):
-        self._binop('|', lhs, rhs, res)
-
-    def op_BINARY_XOR(self, inst, lhs, rhs, res):
-        self._binop('^', lhs, rhs, res)
-
-    def op_INPLACE_ADD(self, inst, lhs, rhs, res):
-        self._inplace_binop('+', lhs, rhs, res)
-
-    def op_INPLACE_SUBTRACT(self, inst, lhs, rhs, res):
-        self._inplace_binop('-', lhs, rhs, res)
-
-    def op_INPLACE_MULTIPLY(self, inst, lhs, rhs, res):
-        self._inplace_binop('*', lhs, rhs, res)
-
-    def op_INPLACE_DIVIDE(self, inst, lhs, rhs, res):
-        self._inplace_binop('/?', lhs, rhs, res)
-
-    def op_INPLACE_TRUE_DIVIDE(self, inst, lhs, rhs, res):
-        self._inplace_binop('/', lhs, rhs, res)
-
-    def op_INPLACE_FLOOR_DIVIDE(self, inst, lhs, rhs, res):
-        self._inplace_binop('//', lhs, rhs, res)
-
-    def op_INPLACE_MODULO(self, inst, lhs, rhs, res):
-        self._inplace_binop('%', lhs, rhs, res)
-
-    def op_INPLACE_POWER(self, inst, lhs, rhs, res):
-        self._inplace_binop('**', lhs, rhs, res)
-
-    def op_INPLACE_MATRIX_MULTIPLY(self, inst, lhs, rhs, res):
-        self._inplace_binop('@', lhs, rhs, res)
-
-    def op_INPLACE_LSHIFT(self, inst, lhs, rhs, res):
-        self._inplace_binop('<<', lhs, rhs, res)
-
-    def op_INPLACE_RSHIFT(self, inst, lhs, rhs, res):
-        self._inplace_binop('>>', lhs, rhs, res)
-
-    def op_INPLACE_AND(self, inst, lhs, rhs, res):
-        self._inplace_binop('&', lhs, rhs, res)
-
-    def op_INPLACE_OR(self, inst, lhs, rhs, res):
-        self._inplace_binop('|', lhs, rhs, res)
-
-    def op_INPLACE_XOR(self, inst, lhs, rhs, res):
-        self._inplace_binop('^', lhs, rhs, res)
+    def _op_inplace_binop(self, inst, lhs, rhs, res):
+        """
+        Handler of the INPLACE_* opcodes listed in _INPLACE_BINOP_OPNAMES.
+        """
+        op, immuop = _INPLACE_BINOP_FNS[inst.opname]
+        expr = ir.Expr.inplace_binop(op, immuop, self.get(lhs), self.get(rhs),
+                                     self.loc)
+        self.store(expr, res)
 
     def op_JUMP_ABSOLUTE(self, inst):
-        jmp = ir.Jump(inst.get_jump_target(), loc=self.loc)
+        jmp = ir.Jump(inst.get_jump_target(), self.loc)
         self.current_block.append(jmp)
 
     def op_JUMP_FORWARD(self, inst):
-        jmp = ir.Jump(inst.get_jump_target(), loc=self.loc)
+        jmp = ir.Jump(inst.get_jump_target(), self.loc)
         self.current_block.append(jmp)
 
     def op_POP_BLOCK(self, inst, kind=None):
@@ -1576,8 +1673,8 @@ class Interpreter(object):
             self._insert_try_block_end()
 
     def op_RETURN_VALUE(self, inst, retval, castval):
-        self.store(ir.Expr.cast(self.get(retval), loc=self.loc), castval)
-        ret = ir.Return(self.get(castval), loc=self.loc)
+        self.store(ir.Expr.cast(self.get(retval), self.loc), castval)
+        ret = ir.Return(self.get(castval), self.loc)
         self.current_block.append(ret)
 
     def op_COMPARE_OP(self, inst, lhs, rhs, res):
@@ -1588,19 +1685,17 @@ class Interpreter(object):
         if op == 'not in':
             self._binop('in', lhs, rhs, res)
             tmp = self.get(res)
-            out = ir.Expr.unary('not', value=tmp, loc=self.loc)
+            out = ir.Expr.unary('not', tmp, self.loc)
             self.store(out, res)
         elif op == 'exception match':
-            gv_fn = ir.Global(
-                "exception_match", eh.exception_match, loc=self.loc,
-            )
+            gv_fn = ir.Global("exception_match", eh.exception_match,
+                              self.loc)
             exc_match_name = '$exc_match'
             self.store(value=gv_fn, name=exc_match_name, redefine=True)
             lhs = self.get(lhs)
             rhs = self.get(rhs)
-            exc = ir.Expr.call(
-                self.get(exc_match_name), args=(lhs, rhs), kws=(), loc=self.loc,
-            )
+            exc = ir.Expr.call(self.get(exc_match_name), (lhs, rhs), (),
+                               self.loc)
             self.store(exc, res)
         else:
             self._binop(op, lhs, rhs, res)
@@ -1616,7 +1711,7 @@ class Interpreter(object):
         # invert if op case is 1
         if inst.arg == 1:
             tmp = self.get(res)
-            out = ir.Expr.unary('not', value=tmp, loc=self.loc)
+            out = ir.Expr.unary('not', tmp, self.loc)
             self.store(out, res)
 
     def op_BREAK_LOOP(self, inst, end=None):
@@ -1624,7 +1719,7 @@ class Interpreter(object):
             loop = self.syntax_blocks[-1]
             assert isinstance(loop, ir.Loop)
             end = loop.exit
-        jmp = ir.Jump(target=end, loc=self.loc)
+        jmp = ir.Jump(end, self.loc)
         self.current_block.append(jmp)
 
     def _op_JUMP_IF(self, inst, pred, iftrue):
@@ -1636,16 +1731,15 @@ class Interpreter(object):
         falsebr = brs[not iftrue]
 
         name = "bool%s" % (inst.offset)
-        gv_fn = ir.Global("bool", bool, loc=self.loc)
+        gv_fn = ir.Global("bool", bool, self.loc)
         self.store(value=gv_fn, name=name)
 
         callres = ir.Expr.call(self.get(name), (self.get(pred),), (),
-                               loc=self.loc)
+                               self.loc)
 
         pname = "$%spred" % (inst.offset)
         predicate = self.store(value=callres, name=pname)
-        bra = ir.Branch(cond=predicate, truebr=truebr, falsebr=falsebr,
-                        loc=self.loc)
+        bra = ir.Branch(predicate, truebr, falsebr, self.loc)
         self.current_block.append(bra)
 
     def op_JUMP_IF_FALSE(self, inst, pred):
@@ -1669,19 +1763,15 @@ class Interpreter(object):
     def op_JUMP_IF_NOT_EXC_MATCH(self, inst, pred, tos, tos1):
         truebr = inst.next
         falsebr = inst.get_jump_target()
-        gv_fn = ir.Global(
-            "exception_match", eh.exception_match, loc=self.loc,
-        )
+        gv_fn = ir.Global("exception_match", eh.exception_match, self.loc)
         exc_match_name = '$exc_match'
         self.store(value=gv_fn, name=exc_match_name, redefine=True)
         lhs = self.get(tos1)
         rhs = self.get(tos)
-        exc = ir.Expr.call(
-            self.get(exc_match_name), args=(lhs, rhs), kws=(), loc=self.loc,
-        )
+        exc = ir.Expr.call(self.get(exc_match_name), (lhs, rhs), (),
+                           self.loc)
         predicate = self.store(exc, pred)
-        bra = ir.Branch(cond=predicate, truebr=truebr, falsebr=falsebr,
-                        loc=self.loc)
+        bra = ir.Branch(predicate, truebr, falsebr, self.loc)
         self.current_block.append(bra)
 
     def op_RERAISE(self, inst, exc):
@@ -1698,19 +1788,19 @@ class Interpreter(object):
         tryblk = self.dfainfo.active_try_block
         if tryblk is not None:
             # In a try block
-            stmt = ir.TryRaise(exception=exc, loc=self.loc)
+            stmt = ir.TryRaise(exc, self.loc)
             self.current_block.append(stmt)
             self._insert_try_block_end()
-            self.current_block.append(ir.Jump(tryblk['end'], loc=self.loc))
+            self.current_block.append(ir.Jump(tryblk['end'], self.loc))
         else:
             # Not in a try block
-            stmt = ir.Raise(exception=exc, loc=self.loc)
+            stmt = ir.Raise(exc, self.loc)
             self.current_block.append(stmt)
 
     def op_YIELD_VALUE(self, inst, value, res):
         # initialize index to None.  it's being set later in post-processing
         index = None
-        inst = ir.Yield(value=self.get(value), index=index, loc=self.loc)
+        inst = ir.Yield(self.get(value), self.loc, index)
         return self.store(inst, res)
 
     def op_MAKE_FUNCTION(self, inst, name, code, closure, annotations,
@@ -1760,16 +1850,16 @@ class Interpreter(object):
             idx = inst.arg - n_cellvars
             name = self.code_freevars[idx]
             value = self.get_closure_value(idx)
-            gl = ir.FreeVar(idx, name, value, loc=self.loc)
+            gl = ir.FreeVar(idx, name, value, self.loc)
         self.store(gl, res)
 
     def op_LIST_APPEND(self, inst, target, value, appendvar, res):
         target = self.get(target)
         value = self.get(value)
-        appendattr = ir.Expr.getattr(target, 'append', loc=self.loc)
+        appendattr = ir.Expr.getattr(target, 'append', self.loc)
         self.store(value=appendattr, name=appendvar)
         appendinst = ir.Expr.call(self.get(appendvar), (value,), (),
-                                  loc=self.loc)
+                                  self.loc)
         self.store(value=appendinst, name=res)
 
     def op_LIST_EXTEND(self, inst, target, value, extendvar, res):
@@ -1829,36 +1919,22 @@ class Interpreter(object):
             build_list.items = build_tuple.items
         else:
             # it's just a list extend with no static init, let it be
-            extendattr = ir.Expr.getattr(target, 'extend', loc=self.loc)
+            extendattr = ir.Expr.getattr(target, 'extend', self.loc)
             self.store(value=extendattr, name=extendvar)
             extendinst = ir.Expr.call(self.get(extendvar), (value,), (),
-                                      loc=self.loc)
+                                      self.loc)
             self.store(value=extendinst, name=res)
 
     def op_MAP_ADD(self, inst, target, key, value, setitemvar, res):
         target = self.get(target)
         key = self.get(key)
         value = self.get(value)
-        setitemattr = ir.Expr.getattr(target, '__setitem__', loc=self.loc)
+        setitemattr = ir.Expr.getattr(target, '__setitem__', self.loc)
         self.store(value=setitemattr, name=setitemvar)
         appendinst = ir.Expr.call(self.get(setitemvar), (key, value,), (),
-                                  loc=self.loc)
+                                  self.loc)
         self.store(value=appendinst, name=res)
 
     def op_LOAD_ASSERTION_ERROR(self, inst, res):
-        gv_fn = ir.Global("AssertionError", AssertionError, loc=self.loc)
+        gv_fn = ir.Global("AssertionError", AssertionError, self.loc)
         self.store(value=gv_fn, name=res)
-
-    # NOTE: The LOAD_METHOD opcode is implemented as a LOAD_ATTR for ease,
-    # however this means a new object (the bound-method instance) could be
-    # created. Conversely, using a pure LOAD_METHOD no intermediary is present
-    # and it is essentially like a pointer grab and forward to CALL_METHOD. The
-    # net outcome is that the implementation in Numba produces the same result,
-    # but in object mode it may be that it runs more slowly than it would if
-    # run in CPython.
-
-    def op_LOAD_METHOD(self, *args, **kws):
-        self.op_LOAD_ATTR(*args, **kws)
-
-    def op_CALL_METHOD(self, *args, **kws):
-        self.op_CALL_FUNCTION(*args, **kws)
@@ -26,6 +26,8 @@ class Loc(object):
     """Source location
 
     """
+    __slots__ = 'filename', 'line', 'col', 'lines', 'maybe_decorator'
+
     _defmatcher = re.compile(r'def\s+(\w+)\(.*')
 
     def __init__(self, filename, line, col=None, maybe_decorator=False):
@@ -0,0 +1,68 @@
+import functools
+import inspect
+import types
+import unittest
+
+from numba.core.bytecode import FunctionIdentity, get_arg_names
+from numba.tests.support import TestCase
+
+
+def _listcomp_function():
+    """
+    Get a function of the code object of a list comprehension, which has
+    the implicit ``.0`` argument.
+    """
+    code = compile('[x for x in y]', '<listcomp>', 'eval')
+    listcomp = [c for c in code.co_consts if isinstance(c, types.CodeType)]
+    return types.FunctionType(listcomp[0], {})
+
+
+class TestFunctionIdentity(TestCase):
+
+    def check_arg_names(self, fn, expected):
+        func_id = FunctionIdentity.from_function(fn)
+        self.assertEqual(get_arg_names(fn.__code__), expected)
+        self.assertEqual(func_id.arg_names, expected)
+        self.assertEqual(func_id.arg_count, len(expected))
+        return func_id
+
+    def test_arg_names(self):
+        # arg_names follows the order of the signature
+        def foo(a, b=1, *args, c, d=2, **kws):
+            e = a
+            return e
+
+        def bar(a, b, *, c):
+            pass
+
+        def baz():
+            pass
+
+        for fn in (foo, bar, baz):
+            expected = list(inspect.signature(fn).parameters)
+            func_id = self.check_arg_names(fn, expected)
+            self.assertEqual(func_id.pysig, inspect.signature(fn))
+
+    def test_arg_names_comprehension(self):
+        # the implicit argument of a comprehension is named as in
+        # inspect.signature()
+        fn = _listcomp_function()
+        func_id = self.check_arg_names(fn, ['implicit0'])
+        self.assertEqual(list(func_id.pysig.parameters), ['implicit0'])
+
+    def test_arg_names_wrapped(self):
+        # arg_names are those of the compiled bytecode, pysig follows
+        # __wrapped__
+        def inner(a, b):
+            return a + b
+
+        @functools.wraps(inner)
+        def outer(*args):
+            return inner(*args)
+
+        func_id = self.check_arg_names(outer, ['args'])
+        self.assertEqual(list(func_id.pysig.parameters), ['a', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
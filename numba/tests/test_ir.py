@@ -1,10 +1,11 @@
+import collections
 import unittest
 from unittest.case import TestCase
 import warnings
 import numpy as np
 
 from numba import objmode
-from numba.core import ir, compiler
+from numba.core import bytecode, interpreter, ir, compiler
 from numba.core import errors
 from numba.core.compiler import (
     CompilerBase,
@@ -22,6 +23,16 @@ from numba.core.untyped_passes import (
 from numba import njit
 
 
+def interpret(func):
+    """
+    Get the FunctionIR of *func* straight from the interpreter, without
+    any of the compiler's passes.
+    """
+    func_id = bytecode.FunctionIdentity.from_function(func)
+    bc = bytecode.ByteCode(func_id=func_id)
+    return interpreter.Interpreter(func_id).interpret(bc)
+
+
 class TestIR(unittest.TestCase):
 
     def test_IRScope(self):
@@ -484,6 +495,75 @@ class TestIRCompounds(CheckEquality):
         check_diffstr(tmp, ["c + b", "b + c"])
 
 
+class TestInterpreterOpTable(unittest.TestCase):
+
+    def test_aliases(self):
+        # LOAD_METHOD and CALL_METHOD use the LOAD_ATTR and CALL_FUNCTION
+        # handlers of the class, including overridden ones
+        class MyInterpreter(interpreter.Interpreter):
+            def op_LOAD_ATTR(self, inst, item, res):
+                pass
+
+        base = interpreter.Interpreter._get_op_table()
+        table = MyInterpreter._get_op_table()
+        self.assertIs(base['LOAD_METHOD'][0],
+                      interpreter.Interpreter.op_LOAD_ATTR)
+        self.assertIs(table['LOAD_METHOD'][0], MyInterpreter.op_LOAD_ATTR)
+        self.assertIs(table['CALL_METHOD'][0],
+                      interpreter.Interpreter.op_CALL_FUNCTION)
+
+    def test_bind_handler_args(self):
+        bind = interpreter._bind_handler_args
+        params = interpreter.Interpreter._get_op_table()['SETUP_WITH'][1]
+        self.assertEqual(bind(params, {'contextmanager': '$cm'}),
+                         ('$cm', None))
+        self.assertEqual(bind(params, {'contextmanager': '$cm',
+                                       'exitfn': '$fn'}),
+                         ('$cm', '$fn'))
+        # unknown keyword, even though the handler has a default
+        with self.assertRaises(TypeError):
+            bind(params, {'contextmanager': '$cm', 'exitfm': '$fn'})
+        # missing required argument
+        with self.assertRaises(TypeError):
+            bind(params, {'exitfn': '$fn'})
+
+
+class TestInterpreterLoc(unittest.TestCase):
+
+    def test_loc_shared_per_line(self):
+        # the interpreter uses a single ir.Loc per source line
+        def foo(a, b):
+            c = a + b; d = c * a  # noqa: E702
+            return d
+
+        func_ir = interpret(foo)
+        locs = collections.defaultdict(set)
+        for blk in func_ir.blocks.values():
+            for stmt in blk.body:
+                locs[stmt.loc.line].add(id(stmt.loc))
+        self.assertEqual(len(locs), 2)
+        for ids in locs.values():
+            self.assertEqual(len(ids), 1)
+
+    def test_slots(self):
+        # the interpreter and ir.Loc have no instance __dict__, and the
+        # interpreter still runs with the bytecode handler table
+        def foo(a, b):
+            for i in range(a):
+                b += i
+            return b
+
+        func_id = bytecode.FunctionIdentity.from_function(foo)
+        self.assertFalse(hasattr(interpreter.Interpreter(func_id), '__dict__'))
+        func_ir = interpret(foo)
+        self.assertIsInstance(func_ir, ir.FunctionIR)
+        self.assertFalse(hasattr(func_ir.loc, '__dict__'))
+        exprs = [expr.op for blk in func_ir.blocks.values()
+                 for expr in blk.find_exprs()]
+        self.assertIn('iternext', exprs)
+        self.assertIn('inplace_binop', exprs)
+
+
 class TestIRPedanticChecks(TestCase):
     def test_var_in_scope_assumption(self):
         # Create a pass that clears ir.Scope in ir.Block